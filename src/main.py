@@ -1,4 +1,7 @@
 import time
+import asyncio
+import atexit
+import functools
 import gzip
 import io
 import json
@@ -6,22 +9,27 @@ import os
 import pathlib
 import re
 import sys
-import xml.etree.ElementTree as ET
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from urllib.parse import urljoin, urlparse
 from analyzer.prompts import SYSTEM_SCORER, build_user_prompt
 from analyzer.scoring import aggregate_chunk_results
 import click
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
 from dotenv import load_dotenv
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from google import genai
 from google.genai import types as genai_types
-from openai import OpenAI
+from openai import AsyncOpenAI
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -61,6 +69,12 @@ _PRIVACY_REGEX_PATTERNS = [
     re.compile(r"\bterms\b", re.IGNORECASE),                 # 9
 ]
 
+# All patterns fused into one alternation, one capture group per pattern in
+# priority order; m.lastindex - 1 is the index of the pattern that matched.
+_FUSED_PRIVACY_REGEX = re.compile(
+    "|".join(f"({p.pattern})" for p in _PRIVACY_REGEX_PATTERNS), re.IGNORECASE
+)
+
 _PRIVACY_CUES = (
     "privacy",
     "privacy-policy",
@@ -85,6 +99,8 @@ _PRIVACY_CUES = (
     "개인정보",
     "privatsphäre",
 )
+# Single alternation so _is_privacy_like scans the string once in the C engine.
+_CUES_RE = re.compile("|".join(re.escape(c) for c in _PRIVACY_CUES), re.IGNORECASE)
 
 _PRIVACY_KEYWORDS = [
     "privacy policy",
@@ -107,6 +123,15 @@ _COMMON_PATHS = [
 # Selenium timeouts (seconds)
 _SELENIUM_PAGE_LOAD_TIMEOUT = 10
 _SELENIUM_WAIT_TIMEOUT = 5
+# "--headless=new" renders like full Chrome; classic "--headless" starts faster
+_SELENIUM_HEADLESS_ARG = "--headless=new"
+# Returns innerText of <main> if it has enough text (arguments[0]), else <body>
+_SELENIUM_EXTRACT_TEXT_JS = (
+    "var m = document.querySelector('main');"
+    "var el = (m && m.innerText && m.innerText.trim().length > arguments[0])"
+    " ? m : document.body;"
+    "return el ? el.innerText : '';"
+)
 
 # Minimum character thresholds for extracted text
 _MIN_TEXT_LENGTH_MAIN = 100    # <main> tag must exceed this to be considered valid
@@ -115,6 +140,38 @@ _MIN_TEXT_LENGTH_POLICY = 400  # extracted policy text must exceed this to be ke
 # Priority/discovery configurations
 _NO_MATCH_PRIORITY = 999
 _MAX_SPECIFIC_PRIORITY = 2  # Priorities <= 2 are considered highly specific policy pages
+_PROBE_MAX_WORKERS = 10  # Concurrent HEAD probes for candidate verification
+_MAX_CHILD_SITEMAPS = 5  # Child sitemaps followed (concurrently) from a sitemap index
+_MAX_SITEMAP_DEPTH = 1  # Index levels followed: index -> children, never deeper
+
+_LINK_PARSE_SLICE = 64 * 1024  # Characters fed to the HTML pull parser per step
+
+_SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+_SITEMAP_LOC_TAG = f"{_SITEMAP_NS}loc"
+_SITEMAP_ENTRY_TAGS = (f"{_SITEMAP_NS}url", f"{_SITEMAP_NS}sitemap")
+
+_HTTP_MAX_BYTES = 512_000  # Default body cap for _http_get (discovery pages)
+_HTTP_READ_CHUNK = 64 * 1024
+_SITEMAP_MAX_BYTES = 10_000_000  # Sitemaps are stream-parsed, allow much larger bodies
+
+# Shared HTTP session: discovery hits the same host many times, so keep-alive
+# connections are reused instead of paying a TCP/TLS handshake per request.
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "User-Agent": "PrivacyPolicyAnalyzer/0.2 (+https://example.org)",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+)
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    # Never honour Retry-After: a rate-limiting server could stall discovery for hours
+    max_retries=Retry(total=1, backoff_factor=0.1, respect_retry_after_header=False),
+)
+_SESSION.mount("http://", _HTTP_ADAPTER)
+_SESSION.mount("https://", _HTTP_ADAPTER)
 
 def _is_privacy_like(s: str) -> bool:
     """Heuristic check for privacy-related terms in a string.
@@ -125,33 +182,40 @@ def _is_privacy_like(s: str) -> bool:
     Returns:
         True if any privacy cue is found in the string, False otherwise.
     """
-    s = (s or "").lower()
-    return any(k in s for k in _PRIVACY_CUES)
+    return bool(_CUES_RE.search(s or ""))
 
 
-def _http_get(url: str, timeout: int = 5) -> requests.Response | None:
-    """HTTP GET with basic headers and redirects allowed.
+def _http_get(
+    url: str, timeout: int = 5, max_bytes: int | None = _HTTP_MAX_BYTES
+) -> requests.Response | None:
+    """HTTP GET via the shared session; redirects allowed.
+
+    The body is streamed and truncated to ``max_bytes``: link discovery only
+    needs the head of a page, so downstream parsing of huge pages is
+    intentionally cut short. Pass ``max_bytes=None`` to read the full body.
 
     Args:
         url: The target URL to send the GET request to.
         timeout: Timeout in seconds for the request. Defaults to 5.
+        max_bytes: Maximum number of body bytes to read. Defaults to
+            _HTTP_MAX_BYTES; None disables the cap.
 
     Returns:
         The requests.Response object if status is OK (< 400) and contains text,
         otherwise None.
     """
     try:
-        r = requests.get(
-            url,
-            timeout=timeout,
-            allow_redirects=True,
-            headers={
-                "User-Agent": "PrivacyPolicyAnalyzer/0.2 (+https://example.org)",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-            },
-        )
-        return r if (r.status_code < 400 and r.text) else None
+        with _SESSION.get(url, timeout=timeout, allow_redirects=True, stream=True) as r:
+            if r.status_code >= 400:
+                return None
+            if max_bytes is not None:
+                buf = bytearray()
+                for chunk in r.iter_content(chunk_size=_HTTP_READ_CHUNK):
+                    buf += chunk
+                    if len(buf) >= max_bytes:
+                        break
+                r._content = bytes(buf[:max_bytes])
+            return r if r.text else None
     except Exception:
         return None
 
@@ -170,9 +234,13 @@ def _fetch_text(url: str, timeout: int = 5) -> str | None:
     return r.text if r else None
 
 
+@functools.lru_cache(maxsize=256)
 def _head_ok(url: str, timeout: int = 3) -> bool:
     """Lightweight existence probe using HEAD; redirects considered OK.
 
+    Results are memoized per (url, timeout); resolve_privacy_url clears the
+    cache on entry so each resolve sees fresh results.
+
     Args:
         url: The target URL to probe.
         timeout: Timeout in seconds for the request. Defaults to 3.
@@ -182,16 +250,7 @@ def _head_ok(url: str, timeout: int = 3) -> bool:
         a redirect status code (3xx), False otherwise.
     """
     try:
-        r = requests.head(
-            url,
-            timeout=timeout,
-            allow_redirects=True,
-            headers={
-                "User-Agent": "PrivacyPolicyAnalyzer/0.2 (+https://example.org)",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-            },
-        )
+        r = _SESSION.head(url, timeout=timeout, allow_redirects=True)
         if 200 <= r.status_code < 300:
             return True
         if r.status_code in (301, 302, 303, 307, 308):
@@ -201,6 +260,56 @@ def _head_ok(url: str, timeout: int = 3) -> bool:
         return False
 
 
+def _iter_links(html_content: str) -> Iterator[tuple[str, str]]:
+    """Yield (href, anchor_text) for every <a href> in document order.
+
+    The HTML is fed to lxml's pull parser in slices and links are yielded as
+    soon as their closing tag is seen, so a caller that stops iterating early
+    (candidate limit, priority-0 hit) never parses the rest of the page.
+
+    Args:
+        html_content: The HTML page content to extract links from.
+
+    Yields:
+        Tuples of (raw href value, stripped anchor text).
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="a")
+    try:
+        for start in range(0, len(html_content), _LINK_PARSE_SLICE):
+            parser.feed(html_content[start : start + _LINK_PARSE_SLICE])
+            yield from _read_link_events(parser)
+        parser.close()
+        yield from _read_link_events(parser)
+    except etree.Error:
+        return
+
+
+def _read_link_events(parser: etree.HTMLPullParser) -> Iterator[tuple[str, str]]:
+    """Drain pending <a> end events from a pull parser as (href, anchor_text)."""
+    for _, elem in parser.read_events():
+        href = elem.get("href")
+        if href is not None:
+            yield href, "".join(t.strip() for t in elem.itertext())
+        elem.clear(keep_tail=True)
+
+
+def _extract_main_text(html_content: str) -> str:
+    """Return visible text of the <main> element, falling back to <body>.
+
+    Args:
+        html_content: The HTML page content to extract text from.
+
+    Returns:
+        The stripped, newline-separated text, or an empty string if neither
+        element exists.
+    """
+    soup = BeautifulSoup(html_content, "lxml")
+    content_element = soup.find("main")
+    if not content_element or not content_element.get_text(strip=True):
+        content_element = soup.find("body")
+    return content_element.get_text("\n").strip() if content_element else ""
+
+
 def _extract_text_http(url: str) -> str | None:
     """Fetch text from <main> tag, fallback to <body>.
 
@@ -220,26 +329,30 @@ def _extract_text_http(url: str) -> str | None:
                 return t if len(t) >= _MIN_TEXT_LENGTH_POLICY else None
         except Exception:
             pass
-    r = _http_get(url)
+    r = _http_get(url, max_bytes=None)  # policy text is consumed in full
     if not r:
         return None
-    
-    soup = BeautifulSoup(r.text, "html.parser")
-    
-    # Extraction Logic: Prefer <main>, fallback to <body>
-    content_element = soup.find("main")
-    if not content_element or not content_element.get_text(strip=True):
-        content_element = soup.find("body")
-        
-    t = content_element.get_text("\n").strip() if content_element else ""
+
+    t = _extract_main_text(r.text)
     return t if len(t) >= _MIN_TEXT_LENGTH_POLICY else None
 
 
-def fetch_content_with_selenium(url: str) -> str | None:
-    """Return visible text using headless Chrome; robust for dynamic pages."""
-    chromedriver_autoinstaller.install()
+# Shared headless Chrome instance; Chrome startup dominates a Selenium fetch,
+# so the driver is created once and reused until the process exits.
+_DRIVER: webdriver.Chrome | None = None
+_CHROMEDRIVER_INSTALLED = False
+
+
+def _get_driver() -> webdriver.Chrome:
+    """Return the shared headless Chrome driver, creating it on first use."""
+    global _DRIVER, _CHROMEDRIVER_INSTALLED
+    if _DRIVER is not None:
+        return _DRIVER
+    if not _CHROMEDRIVER_INSTALLED:
+        chromedriver_autoinstaller.install()
+        _CHROMEDRIVER_INSTALLED = True
     opts = Options()
-    opts.add_argument("--headless=new")
+    opts.add_argument(_SELENIUM_HEADLESS_ARG)
     opts.add_argument("--disable-gpu")
     opts.add_argument("--no-sandbox")
     opts.add_argument("--disable-dev-shm-usage")
@@ -249,29 +362,61 @@ def fetch_content_with_selenium(url: str) -> str | None:
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
     )
     opts.add_argument("--blink-settings=imagesEnabled=false") # do not load images
+    # Trim background work; none of it matters for innerText extraction
+    opts.add_argument("--disable-background-networking")
+    opts.add_argument("--disable-sync")
+    opts.add_argument("--disable-translate")
+    opts.add_argument("--metrics-recording-only")
+    opts.add_argument("--mute-audio")
+    # Block images, stylesheets, fonts and plugins; JS stays on for client-rendered policies
+    opts.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+        },
+    )
     opts.page_load_strategy = 'eager'  # do not wait for full load
-    driver = webdriver.Chrome(options=opts)
+    _DRIVER = webdriver.Chrome(options=opts)
+    _DRIVER.set_page_load_timeout(_SELENIUM_PAGE_LOAD_TIMEOUT)
+    _DRIVER.implicitly_wait(0)
+    return _DRIVER
+
+
+def _quit_driver() -> None:
+    """Shut down the shared Chrome driver, if one was started."""
+    global _DRIVER
+    if _DRIVER is None:
+        return
+    try:
+        _DRIVER.quit()
+    except Exception:
+        pass
+    _DRIVER = None
+
+
+atexit.register(_quit_driver)
+
+
+def fetch_content_with_selenium(url: str) -> str | None:
+    """Return visible text using headless Chrome; robust for dynamic pages."""
+    driver = _get_driver()
     try:
-        driver.set_page_load_timeout(_SELENIUM_PAGE_LOAD_TIMEOUT)
         driver.get(url)
         WebDriverWait(driver, _SELENIUM_WAIT_TIMEOUT).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        
-        # Selenium Extraction: Prefer <main>, fallback to <body>
-        try:
-            content_element = driver.find_element(By.TAG_NAME, "main")
-            text = content_element.get_attribute("innerText")
-            if text and len(text.strip()) > _MIN_TEXT_LENGTH_MAIN:
-                return text
-        except Exception:
-            pass
-            
-        return driver.find_element(By.TAG_NAME, "body").get_attribute("innerText")
+        # Prefer <main>, fallback to <body>, in a single in-browser round-trip
+        text = driver.execute_script(_SELENIUM_EXTRACT_TEXT_JS, _MIN_TEXT_LENGTH_MAIN)
+        return text or None
+    except TimeoutException:
+        return None
     except Exception:
+        # The session may be wedged (crashed tab, dead chromedriver); start fresh next time
+        _quit_driver()
         return None
-    finally:
-        driver.quit()
 
 
 def fetch_policy_text(url: str, prefer: str = "auto") -> str | None:
@@ -297,10 +442,14 @@ def _light_verify(url: str) -> bool:
     return _head_ok(url, timeout=3) #only check for existence
 
 
-def _get_sitemaps_from_robots(base_url: str) -> list[str]:
-    """Extract sitemap URLs from robots.txt; also try the default /sitemap.xml."""
-    parsed = urlparse(base_url)
-    robots = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+def _get_sitemaps_from_robots(base: str) -> list[str]:
+    """Extract sitemap URLs from robots.txt; also try the default /sitemap.xml.
+
+    Args:
+        base: The site origin ("scheme://netloc", no trailing slash), as
+            already computed by resolve_privacy_url.
+    """
+    robots = f"{base}/robots.txt"
     out: list[str] = []
     txt = _fetch_text(robots)
     if txt:
@@ -310,7 +459,7 @@ def _get_sitemaps_from_robots(base_url: str) -> list[str]:
                 sm = line.split(":", 1)[1].strip()
                 if sm:
                     out.append(sm)
-    default_sm = f"{parsed.scheme}://{parsed.netloc}/sitemap.xml"
+    default_sm = f"{base}/sitemap.xml"
     if default_sm not in out:
         out.append(default_sm)
     seen, uniq = set(), []
@@ -321,36 +470,65 @@ def _get_sitemaps_from_robots(base_url: str) -> list[str]:
     return uniq
 
 
-def _fetch_sitemap_urls(url: str, max_urls: int = 50) -> list[str]:
-    """Return privacy-like URLs found in the sitemap (gz and index supported)."""
-    r = _http_get(url)
+def _fetch_sitemap_urls(url: str, max_urls: int = 50, depth: int = 0) -> list[str]:
+    """Return privacy-like URLs found in the sitemap (gz and index supported).
+
+    The XML is stream-parsed so large sitemaps are never held as a full tree,
+    and parsing stops as soon as enough URLs have been collected. A sitemap
+    index is only followed down to _MAX_SITEMAP_DEPTH levels, so cyclic or
+    self-referencing indexes terminate.
+
+    Args:
+        url: The sitemap (or sitemap index) URL.
+        max_urls: Maximum number of privacy-like URLs to collect. Defaults to 50.
+        depth: Current index nesting level; callers leave it at 0.
+    """
+    r = _http_get(url, max_bytes=_SITEMAP_MAX_BYTES)
     if not r:
         return []
-    data = r.content
+    stream: io.BufferedIOBase = io.BytesIO(r.content)
     if url.endswith(".gz"):
-        try:
-            data = gzip.GzipFile(fileobj=io.BytesIO(data)).read()
-        except Exception:
-            return []
+        stream = gzip.GzipFile(fileobj=stream)
+
+    is_index: bool | None = None
+    children: list[str] = []
+    urls: list[str] = []
     try:
-        root = ET.fromstring(data)
+        for event, elem in etree.iterparse(
+            stream, events=("start", "end"), resolve_entities=False
+        ):
+            if is_index is None:
+                # The first event is the root's start tag: <sitemapindex> or <urlset>
+                is_index = elem.tag.endswith("sitemapindex")
+                continue
+            if event != "end":
+                continue
+            if elem.tag == _SITEMAP_LOC_TAG:
+                u = (elem.text or "").strip()
+                if is_index:
+                    children.append(u)
+                    if len(children) >= _MAX_CHILD_SITEMAPS:
+                        break
+                elif u and _is_privacy_like(u):
+                    urls.append(u)
+                    if len(urls) >= max_urls:
+                        break
+            elif elem.tag in _SITEMAP_ENTRY_TAGS:
+                # Drop finished <url>/<sitemap> entries to keep memory flat
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
     except Exception:
-        return []
-    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-    urls: list[str] = []
-    if root.tag.endswith("sitemapindex"):
-        for i, loc in enumerate(root.findall(".//sm:loc", ns)):
-            if i >= 5:
-                break
-            child = (loc.text or "").strip()
-            urls.extend(_fetch_sitemap_urls(child, max_urls=max_urls))
-            if len(urls) >= max_urls:
-                break
-    else:
-        for loc in root.findall(".//sm:loc", ns):
-            u = (loc.text or "").strip()
-            if u and _is_privacy_like(u):
-                urls.append(u)
+        # Malformed or truncated XML: keep whatever was parsed before the error
+        pass
+
+    if is_index and children and depth < _MAX_SITEMAP_DEPTH:
+        with ThreadPoolExecutor(max_workers=len(children)) as executor:
+            for child_urls in executor.map(
+                functools.partial(_fetch_sitemap_urls, max_urls=max_urls, depth=depth + 1),
+                children,
+            ):
+                urls.extend(child_urls)
                 if len(urls) >= max_urls:
                     break
     seen, uniq = set(), []
@@ -361,9 +539,13 @@ def _fetch_sitemap_urls(url: str, max_urls: int = 50) -> list[str]:
     return uniq
 
 
+@functools.lru_cache(maxsize=4096)
 def _get_url_priority(url: str) -> int:
     """Return the priority index of a URL based on regex patterns. Lower is better.
 
+    Results are memoized since the same URLs and anchors are scored repeatedly
+    across link collection, candidate scoring and verification.
+
     Args:
         url: The URL to evaluate.
 
@@ -371,10 +553,16 @@ def _get_url_priority(url: str) -> int:
         The priority index (0-based) based on the matching regex pattern,
         or _NO_MATCH_PRIORITY if no pattern matches.
     """
-    for idx, pattern in enumerate(_PRIVACY_REGEX_PATTERNS):
-        if pattern.search(url):
-            return idx
-    return _NO_MATCH_PRIORITY
+    # The leftmost match is not necessarily the best one ("/legal/privacy-policy"),
+    # so take the best group over all matches, stopping early on priority 0.
+    best = _NO_MATCH_PRIORITY
+    for m in _FUSED_PRIVACY_REGEX.finditer(url):
+        group = m.lastindex
+        assert group is not None  # every alternative is a capture group
+        best = min(best, group - 1)
+        if best == 0:
+            break
+    return best
 
 
 def _get_priority_key(item: tuple[int, str]) -> int:
@@ -395,14 +583,11 @@ def find_best_policy_url(html_content: str, base_url: str) -> tuple[str, int] |
     if not html_content:
         return None
         
-    soup = BeautifulSoup(html_content, "html.parser")
-    
     # Store tuples of (priority_index, full_url)
     matches: list[tuple[int, str]] = []
     seen_urls = set()
 
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+    for href, _ in _iter_links(html_content):
         try:
             full_url = urljoin(base_url, href)
         except Exception as e:
@@ -418,6 +603,9 @@ def find_best_policy_url(html_content: str, base_url: str) -> tuple[str, int] |
 
         # Check regex priority
         priority_idx = _get_url_priority(full_url)
+        # Nothing can beat the top pattern, so stop scanning on the first hit
+        if priority_idx == 0:
+            return (full_url, 0)
         if priority_idx < _NO_MATCH_PRIORITY:
             matches.append((priority_idx, full_url))
 
@@ -470,11 +658,9 @@ def _collect_link_candidates(html_content: str, base_url: str, limit: int = 100)
     if not html_content:
         return []
     
-    soup = BeautifulSoup(html_content, "html.parser")
     candidates: dict[str, str] = {}  # url -> best_anchor_text
     
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+    for href, text in _iter_links(html_content):
         try:
             full_url = urljoin(base_url, href)
         except Exception as e:
@@ -484,17 +670,20 @@ def _collect_link_candidates(html_content: str, base_url: str, limit: int = 100)
         if not full_url.startswith("http"):
             continue
         
-        # Get anchor text
-        anchor_text = (a.get_text(strip=True) or "").lower()
+        # Lowered once here; the cue and priority regexes are case-insensitive
+        anchor_text = (text or "").lower()
         
         # select candidates based on privacy-likeness or priority instead of just any link
         url_priority = _get_url_priority(full_url)
-        anchor_priority = _get_url_priority(anchor_text)
+        # A top-priority URL wins scoring outright; skip the remaining links
+        if url_priority == 0:
+            return [(full_url, anchor_text)]
+        # Cheapest checks first; later ones only run for non-matching links
         if (
-            _is_privacy_like(full_url)
+            url_priority < _NO_MATCH_PRIORITY
+            or _is_privacy_like(full_url)
             or _is_privacy_like(anchor_text)
-            or url_priority < _NO_MATCH_PRIORITY
-            or anchor_priority < _NO_MATCH_PRIORITY
+            or _get_url_priority(anchor_text) < _NO_MATCH_PRIORITY
         ):
             existing = candidates.get(full_url, "")
             if (
@@ -560,6 +749,36 @@ def _pick_best_verified_candidate(candidates: list[tuple[str, str]], max_verify:
     return None
 
 
+@functools.lru_cache(maxsize=128)
+def _common_path_candidates(base: str) -> tuple[str, ...]:
+    """Return the _COMMON_PATHS probe URLs for a site origin, built once per origin."""
+    return tuple(base + path for path in _COMMON_PATHS)
+
+
+def _first_verified(urls: Sequence[str]) -> str | None:
+    """Verify candidate URLs concurrently and return the first one that passes.
+
+    URLs are probed in batches of _PROBE_MAX_WORKERS, so lower-priority
+    candidates are never probed once an earlier batch produced a hit.
+
+    Args:
+        urls: Candidate URLs in priority order.
+
+    Returns:
+        The earliest URL in ``urls`` that passes _light_verify, or None.
+    """
+    if not urls:
+        return None
+    with ThreadPoolExecutor(max_workers=min(_PROBE_MAX_WORKERS, len(urls))) as executor:
+        for start in range(0, len(urls), _PROBE_MAX_WORKERS):
+            batch = urls[start : start + _PROBE_MAX_WORKERS]
+            # map() yields results in input order, so priority is preserved
+            for url, ok in zip(batch, executor.map(_light_verify, batch)):
+                if ok:
+                    return url
+    return None
+
+
 def resolve_privacy_url(input_url: str) -> tuple[str, str | None]:
     """Resolve a likely privacy policy URL using link-based discovery, sitemaps, or common paths.
 
@@ -572,16 +791,22 @@ def resolve_privacy_url(input_url: str) -> tuple[str, str | None]:
     # If input looks like privacy policy already
     if _is_privacy_like(input_url):
         return input_url, None
+
+    _head_ok.cache_clear()
     
     parsed = urlparse(input_url)
     base = f"{parsed.scheme}://{parsed.netloc}".rstrip("/")
     
     # === PHASE 1: Link-based discovery ===
-    # Collect links from input page and homepage
+    # Collect links from input page and homepage (fetched concurrently)
     candidates_set: dict[str, str] = {}  # url -> anchor_text
-    
-    for page_url in (input_url, base):
-        if not (resp := _http_get(page_url)):
+    page_urls = [input_url] if input_url.rstrip("/") == base else [input_url, base]
+    with ThreadPoolExecutor(max_workers=len(page_urls)) as executor:
+        pages = list(executor.map(_http_get, page_urls))
+
+    # Input page first, so its anchors win on duplicate URLs
+    for resp in pages:
+        if not resp:
             continue
 
         for url, text in _collect_link_candidates(resp.text, resp.url, limit=100):
@@ -594,17 +819,26 @@ def resolve_privacy_url(input_url: str) -> tuple[str, str | None]:
             return best_url, input_url
     
     # === PHASE 2: Sitemap-based discovery ===
+    # Verify each sitemap's candidates before fetching the next one, so a hit in
+    # the first sitemap never downloads the rest; `seen` skips re-probing URLs
+    # listed in several sitemaps.
+    seen_sitemap_cands: set[str] = set()
     for sm in _get_sitemaps_from_robots(base):
-        for cand in _fetch_sitemap_urls(sm, max_urls=50):
-            if _light_verify(cand):
-                click.secho(f"      DEBUG: Found via sitemap: {cand}", fg="yellow", dim=True, err=True)
-                return cand, input_url
+        sitemap_cands = [
+            cand for cand in _fetch_sitemap_urls(sm, max_urls=50)
+            if cand not in seen_sitemap_cands
+        ]
+        seen_sitemap_cands.update(sitemap_cands)
+        # Probe the most specific policy URLs first rather than in sitemap order
+        sitemap_cands.sort(key=_get_url_priority)
+        if found := _first_verified(sitemap_cands):
+            click.secho(f"      DEBUG: Found via sitemap: {found}", fg="yellow", dim=True, err=True)
+            return found, input_url
     
     # === PHASE 3: Common paths (last resort) ===
-    for candidate_url in (base + path for path in _COMMON_PATHS):
-        if _light_verify(candidate_url):
-            click.secho(f"      DEBUG: Found via common path: {candidate_url}", fg="yellow", dim=True, err=True)
-            return candidate_url, input_url
+    if candidate_url := _first_verified(_common_path_candidates(base)):
+        click.secho(f"      DEBUG: Found via common path: {candidate_url}", fg="yellow", dim=True, err=True)
+        return _improve_candidate(candidate_url), input_url
 
     return input_url, None
 
@@ -635,7 +869,7 @@ def split_text_into_chunks(
     wait=wait_random_exponential(min=2, max=30),
     reraise=True
 )
-def _analyze_chunk_gemini(text_chunk: str, model: str) -> dict[str, Any] | None:
+async def _analyze_chunk_gemini(text_chunk: str, model: str) -> dict[str, Any] | None:
     """Analyze a text chunk using the Google Gemini API.
 
     Args:
@@ -653,7 +887,7 @@ def _analyze_chunk_gemini(text_chunk: str, model: str) -> dict[str, Any] | None:
         raise RuntimeError("GEMINI_API_KEY is not set. Configure your .env file.")
 
     client = genai.Client(api_key=api_key)
-    resp = client.models.generate_content(
+    resp = await client.aio.models.generate_content(
         model=model,
         contents=build_user_prompt(text_chunk),
         config=genai_types.GenerateContentConfig(
@@ -670,12 +904,41 @@ def _analyze_chunk_gemini(text_chunk: str, model: str) -> dict[str, Any] | None:
         return None
 
 
+# Shared async OpenAI client; all concurrent chunk requests reuse its connection
+# pool. It is bound to the running event loop, so _analyze_chunks closes and
+# drops it when the run finishes.
+_OPENAI_CLIENT: AsyncOpenAI | None = None
+
+
+def _get_openai_client() -> AsyncOpenAI:
+    """Return the shared async OpenAI client, creating it on first use.
+
+    Raises:
+        RuntimeError: If OPENAI_API_KEY environment variable is not configured.
+    """
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise RuntimeError("OPENAI_API_KEY is not set. Configure your .env file.")
+        _OPENAI_CLIENT = AsyncOpenAI(api_key=api_key, base_url=os.getenv("OPENAI_BASE_URL"))
+    return _OPENAI_CLIENT
+
+
+async def _close_openai_client() -> None:
+    """Close and drop the shared async OpenAI client, if one was created."""
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is not None:
+        await _OPENAI_CLIENT.close()
+        _OPENAI_CLIENT = None
+
+
 @retry(
     stop=stop_after_attempt(5),
     wait=wait_random_exponential(min=2, max=30),
     reraise=True
 )
-def _analyze_chunk_openai(text_chunk: str, model: str) -> dict[str, Any] | None:
+async def _analyze_chunk_openai(text_chunk: str, model: str) -> dict[str, Any] | None:
     """Analyze a text chunk with the OpenAI API and return one JSON object.
 
     Args:
@@ -688,11 +951,8 @@ def _analyze_chunk_openai(text_chunk: str, model: str) -> dict[str, Any] | None:
     Raises:
         RuntimeError: If OPENAI_API_KEY environment variable is not configured.
     """
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY is not set. Configure your .env file.")
-    client = OpenAI(api_key=api_key, base_url=os.getenv("OPENAI_BASE_URL"))
-    resp = client.chat.completions.create(
+    client = _get_openai_client()
+    resp = await client.chat.completions.create(
         model=model,
         messages=[
             {"role": "system", "content": SYSTEM_SCORER},
@@ -709,7 +969,7 @@ def _analyze_chunk_openai(text_chunk: str, model: str) -> dict[str, Any] | None:
         return None
 
 
-def analyze_chunk_json(text_chunk: str, model: str) -> dict[str, Any] | None:
+async def analyze_chunk_json(text_chunk: str, model: str) -> dict[str, Any] | None:
     """Analyze a text chunk with the LLM and return one JSON object.
 
     Automatically selects the backend based on the model name:
@@ -724,8 +984,33 @@ def analyze_chunk_json(text_chunk: str, model: str) -> dict[str, Any] | None:
         The scored and analyzed dictionary if successful, None otherwise.
     """
     if model.lower().startswith("gemini"):
-        return _analyze_chunk_gemini(text_chunk, model)
-    return _analyze_chunk_openai(text_chunk, model)
+        return await _analyze_chunk_gemini(text_chunk, model)
+    return await _analyze_chunk_openai(text_chunk, model)
+
+
+async def _analyze_chunks(
+    chunks: list[str], model: str, max_concurrency: int
+) -> list[dict[str, Any] | None]:
+    """Analyze all chunks concurrently, at most ``max_concurrency`` in flight.
+
+    Args:
+        chunks: The text chunks to analyze.
+        model: The LLM model name to use.
+        max_concurrency: Maximum number of simultaneous LLM requests.
+
+    Returns:
+        One result per chunk, in chunk order (None where analysis failed).
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(chunk: str) -> dict[str, Any] | None:
+        async with semaphore:
+            return await analyze_chunk_json(chunk, model)
+
+    try:
+        return await asyncio.gather(*(_bounded(chunk) for chunk in chunks))
+    finally:
+        await _close_openai_client()
 
 
 @click.command()
@@ -734,6 +1019,7 @@ def analyze_chunk_json(text_chunk: str, model: str) -> dict[str, Any] | None:
 @click.option("--chunk-size", default=10000, type=int, help="Character-based chunk size.")
 @click.option("--chunk-overlap", default=350, type=int, help="Overlap between chunks.")
 @click.option("--max-chunks", default=30, type=int, help="Hard cap for analyzed chunks.")
+@click.option("--max-workers", default=16, type=click.IntRange(min=1), help="Max concurrent LLM requests.")
 @click.option("--report", type=click.Choice(["summary", "detailed", "full"]), default="summary", help="Report detail level.")
 @click.option("--fetch", "fetch_method", type=click.Choice(["auto", "http", "selenium"]), default="auto", help="Fetch method preference.")
 @click.option("--no-discover", is_flag=True, help="Skip auto-discovery; analyze the given URL as-is.")
@@ -743,13 +1029,12 @@ def main(
     chunk_size: int,
     chunk_overlap: int,
     max_chunks: int,
+    max_workers: int,
     report: str,
     fetch_method: str,
     no_discover: bool,
 ) -> None:
     """Privacy Policy Analyzer \u2013 auto-discovery + JSON scoring."""
-    from concurrent.futures import ThreadPoolExecutor
-
     start_total = time.time()
 
     # --- Phase 1: Resolve URL ---
@@ -788,17 +1073,10 @@ def main(
     start_analysis = time.time()
     results: list[dict[str, Any]] = []
 
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {
-            executor.submit(analyze_chunk_json, chunk, model): i
-            for i, chunk in enumerate(chunks, 1)
-        }
-        for future in futures:
-            idx = futures[future]
-            res = future.result()
-            if res:
-                res["index"] = idx
-                results.append(res)
+    for idx, res in enumerate(asyncio.run(_analyze_chunks(chunks, model, max_workers)), 1):
+        if res:
+            res["index"] = idx
+            results.append(res)
 
     analysis_time = time.time() - start_analysis
     total_time = time.time() - start_total
@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+
+main = pytest.importorskip(
+    "src.main",
+    reason="requires optional runtime deps (dotenv/bs4/requests/selenium/langchain-text-splitters)"
+)
+
+def test_analyze_chunks_preserves_order_and_bounds_concurrency(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_analyze(chunk, model):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (5 - int(chunk)))
+        in_flight -= 1
+        return {"chunk": chunk}
+
+    monkeypatch.setattr(main, "analyze_chunk_json", fake_analyze)
+    chunks = ["0", "1", "2", "3", "4"]
+    results = asyncio.run(main._analyze_chunks(chunks, "test-model", 2))
+    assert [r["chunk"] for r in results] == chunks
+    assert peak <= 2
@@ -0,0 +1,227 @@
+import pytest
+
+main = pytest.importorskip(
+    "src.main",
+    reason="requires optional runtime deps (dotenv/bs4/requests/selenium/langchain-text-splitters)"
+)
+
+_is_privacy_like = getattr(main, "_is_privacy_like")
+
+def test_is_privacy_like_is_case_insensitive():
+    assert _is_privacy_like("https://example.com/Legal/PRIVACY")
+    assert _is_privacy_like("Politique de Confidentialité")
+    assert _is_privacy_like("https://example.de/datenschutz")
+
+def test_is_privacy_like_rejects_unrelated_and_empty():
+    assert not _is_privacy_like("https://example.com/about-us")
+    assert not _is_privacy_like("")
+
+def test_find_best_policy_url_prefers_specific_policy_link():
+    html = (
+        '<a href="/legal">Legal</a>'
+        '<a href="/privacy">Privacy</a>'
+        '<a href="/privacy-policy">Privacy Policy</a>'
+    )
+    best = main.find_best_policy_url(html, "https://example.com/")
+    assert best == ("https://example.com/privacy-policy", 0)
+
+def test_collect_link_candidates_short_circuits_on_top_priority():
+    html = (
+        '<a href="/privacy">Privacy</a>'
+        '<a href="/privacy-policy">Privacy Policy</a>'
+        '<a href="/terms">Terms</a>'
+    )
+    cands = main._collect_link_candidates(html, "https://example.com/")
+    assert cands == [("https://example.com/privacy-policy", "privacy policy")]
+
+class _FakeResponse:
+    def __init__(self, content: bytes, url: str = ""):
+        self.content = content
+        self.text = content.decode()
+        self.url = url
+
+def test_fetch_sitemap_urls_filters_privacy_like(monkeypatch):
+    xml = (
+        b'<?xml version="1.0"?>'
+        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        b"<url><loc>https://example.com/about</loc></url>"
+        b"<url><loc>https://example.com/privacy-policy</loc></url>"
+        b"<url><loc>https://example.com/privacy-policy</loc></url>"
+        b"</urlset>"
+    )
+    monkeypatch.setattr(main, "_http_get", lambda url, **kwargs: _FakeResponse(xml))
+    assert main._fetch_sitemap_urls("https://example.com/sitemap.xml") == [
+        "https://example.com/privacy-policy"
+    ]
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/legal/privacy-policy",
+        "https://example.com/terms-and-privacy",
+        "https://example.com/privacy/policy",
+        "https://example.com/legal-notice",
+        "https://example.com/security-policy#data-protection",
+        "https://example.com/about",
+        "",
+    ],
+)
+def test_get_url_priority_matches_per_pattern_scan(url):
+    expected = next(
+        (i for i, p in enumerate(main._PRIVACY_REGEX_PATTERNS) if p.search(url)),
+        main._NO_MATCH_PRIORITY,
+    )
+    assert main._get_url_priority(url) == expected
+
+def test_first_verified_returns_earliest_hit_not_fastest(monkeypatch):
+    import time
+
+    urls = [f"https://example.com/{i}" for i in range(25)]
+    passing = {urls[3], urls[7]}
+    probed = []
+
+    def fake_verify(url):
+        probed.append(url)
+        # Later URLs answer first, so completion order differs from input order
+        time.sleep(0.001 * (len(urls) - urls.index(url)))
+        return url in passing
+
+    monkeypatch.setattr(main, "_light_verify", fake_verify)
+    assert main._first_verified(urls) == urls[3]
+    # Only the first batch is probed once it contains a hit
+    assert set(probed) <= set(urls[: main._PROBE_MAX_WORKERS])
+
+def test_first_verified_no_hits_returns_none(monkeypatch):
+    monkeypatch.setattr(main, "_light_verify", lambda url: False)
+    assert main._first_verified([]) is None
+    assert main._first_verified(["https://example.com/a"]) is None
+
+def test_extract_main_text_prefers_main_and_falls_back_to_body():
+    assert main._extract_main_text("<body><nav>x</nav><main>Policy text</main></body>") == "Policy text"
+    assert main._extract_main_text("<body><main> </main><p>Body text</p></body>") == "Body text"
+
+def test_fetch_sitemap_urls_follows_index_children(monkeypatch):
+    index = (
+        b'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        b"<sitemap><loc>https://example.com/sitemap-pages.xml</loc></sitemap>"
+        b"</sitemapindex>"
+    )
+    pages = (
+        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        b"<url><loc>https://example.com/privacy-policy</loc></url>"
+        b"</urlset>"
+    )
+    bodies = {
+        "https://example.com/sitemap.xml": index,
+        "https://example.com/sitemap-pages.xml": pages,
+    }
+    monkeypatch.setattr(main, "_http_get", lambda url, **kwargs: _FakeResponse(bodies[url]))
+    assert main._fetch_sitemap_urls("https://example.com/sitemap.xml") == [
+        "https://example.com/privacy-policy"
+    ]
+
+def test_fetch_sitemap_urls_stops_on_self_referencing_index(monkeypatch):
+    index = (
+        b'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        b"<sitemap><loc>https://example.com/sitemap.xml</loc></sitemap>"
+        b"</sitemapindex>"
+    )
+    fetched = []
+
+    def fake_get(url, **kwargs):
+        fetched.append(url)
+        assert len(fetched) < 10, "sitemap index recursion did not stop"
+        return _FakeResponse(index)
+
+    monkeypatch.setattr(main, "_http_get", fake_get)
+    assert main._fetch_sitemap_urls("https://example.com/sitemap.xml") == []
+    assert len(fetched) == 1 + main._MAX_SITEMAP_DEPTH
+
+def test_head_ok_ignores_retry_after_on_429():
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class RateLimited(BaseHTTPRequestHandler):
+        def do_HEAD(self):
+            self.send_response(429)
+            self.send_header("Retry-After", "8")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RateLimited)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/privacy"
+        start = time.monotonic()
+        assert main._head_ok(url, timeout=3) is False
+        assert time.monotonic() - start < 3
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_resolve_privacy_url_stops_at_first_sitemap_with_a_hit(monkeypatch):
+    urlset = (
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<url><loc>https://example.com/{}</loc></url>"
+        "</urlset>"
+    )
+    bodies = {
+        "https://example.com/": "<html><body><a href='/about'>About</a></body></html>",
+        "https://example.com/robots.txt": "\n".join(
+            f"Sitemap: https://example.com/sitemap-{i}.xml" for i in range(5)
+        ),
+        "https://example.com/sitemap-0.xml": urlset.format("privacy-policy"),
+    }
+    for i in range(1, 5):
+        bodies[f"https://example.com/sitemap-{i}.xml"] = urlset.format(f"privacy-{i}")
+    fetched = []
+
+    def fake_get(url, **kwargs):
+        fetched.append(url)
+        return _FakeResponse(bodies[url].encode(), url)
+
+    monkeypatch.setattr(main, "_http_get", fake_get)
+    monkeypatch.setattr(main, "_light_verify", lambda url: True)
+    resolved, _ = main.resolve_privacy_url("https://example.com/")
+    assert resolved == "https://example.com/privacy-policy"
+    assert fetched == [
+        "https://example.com/",
+        "https://example.com/robots.txt",
+        "https://example.com/sitemap-0.xml",
+    ]
+
+class _FakeSession:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def get(self, url, **kwargs):
+        import io
+
+        import requests
+
+        r = requests.Response()
+        r.status_code = 200
+        r.url = url
+        r.encoding = "utf-8"
+        r.raw = io.BytesIO(self.body)
+        return r
+
+def test_http_get_truncates_body_to_max_bytes(monkeypatch):
+    body = b"<a href='/privacy'>x</a>" * 10_000
+    monkeypatch.setattr(main, "_SESSION", _FakeSession(body))
+    url = "https://example.com/"
+
+    r = main._http_get(url, max_bytes=1000)
+    assert r is not None
+    assert len(r.content) == 1000
+    assert len(r.text) == 1000
+    assert r.url == url
+
+    r = main._http_get(url, max_bytes=None)
+    assert r is not None
+    assert r.content == body
+    assert r.url == url